@@ -3,7 +3,9 @@ import mlflow
 import dagshub
 import numpy as np
 from src.preprocessing import FeaturePreprocessor
+from src.shadow import ShadowScorer
 import os
+import time
 
 app = Flask(__name__)
 
@@ -13,7 +15,7 @@ app = Flask(__name__)
 #              repo_name='student-gpa-prediction', 
 #              mlflow=True)
 # mlflow.set_tracking_uri(os.getenv('MLFLOW_TRACKING_URI'))
-from src.mlflow_config import setup_mlflow
+from src.mlflow_config import setup_mlflow, load_registered_model, load_candidate_model
 print("this is working")
 setup_mlflow()
 print("here is where i performed a change")
@@ -22,28 +24,15 @@ print("here is where i performed a change")
 model = None
 preprocessor = None
 model_version = None
+shadow = None
 
 def load_model_from_mlflow():
     """Load the latest model from MLflow registry"""
     global model, model_version
     
     try:
-        # Get the latest version of the registered model
-        client = mlflow.tracking.MlflowClient()
-        model_name = "gpa_predictor"
-        
-        # Get latest version
-        latest_versions = client.get_latest_versions(model_name, stages=["None"])
-        
-        if not latest_versions:
-            raise Exception("No model versions found")
-        
-        latest_version = latest_versions[0].version
-        model_uri = f"models:/{model_name}/{latest_version}"
-        
-        # Load model
-        model = mlflow.sklearn.load_model(model_uri)
-        model_version = latest_version
+        # Load the latest version of the registered model
+        model, model_version = load_registered_model("gpa_predictor")
         
         print(f"✅ Loaded model version {model_version}")
         return True
@@ -52,6 +41,25 @@ def load_model_from_mlflow():
         print(f"❌ Error loading model: {e}")
         return False
 
+def load_shadow_model():
+    """Start shadow scoring of the candidate version named by SHADOW_MODEL_VERSION"""
+    global shadow
+    
+    candidate_version = os.getenv('SHADOW_MODEL_VERSION')
+    if not candidate_version:
+        return False
+    
+    try:
+        # The scorer process loads the candidate itself, so it is never held here
+        shadow = ShadowScorer(load_candidate_model, candidate_version).start()
+        
+        print(f"✅ Shadow scoring with model version {candidate_version}")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error loading shadow model: {e}")
+        return False
+
 # @app._got_first_request
 def initialize():
     """Initialize model and preprocessor on startup"""
@@ -70,7 +78,14 @@ def initialize():
         print("✅ ML Container ready!")
     else:
         print("⚠️ ML Container started but model loading failed")
-initialize()
+    
+    # Optional candidate model scored in the background
+    load_shadow_model()
+
+# The spawned shadow scorer re-imports the launching script as __mp_main__
+# (e.g. `python src/app.py`); it must not load models or start another scorer
+if __name__ != '__mp_main__':
+    initialize()
 
 @app.route('/health', methods=['GET'])
 def health():
@@ -103,7 +118,13 @@ def predict():
         X = preprocessor.preprocess(backend_data)
         
         # Predict
+        start = time.perf_counter()
         prediction = model.predict(X)[0]
+        latency = time.perf_counter() - start
+        
+        # Hand off to the shadow model without waiting for it
+        if shadow is not None:
+            shadow.submit(X, prediction, latency)
         
         # Prepare response
         response = {
@@ -120,6 +141,18 @@ def predict():
             'error': str(e)
         }), 500
 
+@app.route('/shadow', methods=['GET'])
+def shadow_stats():
+    """Comparison between the serving model and the shadow candidate (this worker only)"""
+    if shadow is None:
+        return jsonify({'enabled': False})
+    
+    return jsonify({
+        'enabled': True,
+        'model_version': model_version,
+        **shadow.stats()
+    })
+
 @app.route('/', methods=['GET'])
 def root():
     """Root endpoint"""
@@ -129,7 +162,8 @@ def root():
         'version': '1.0.0',
         'endpoints': {
             'health': '/health',
-            'predict': '/predict (POST)'
+            'predict': '/predict (POST)',
+            'shadow': '/shadow'
         }
     })
 
@@ -18,3 +18,30 @@ def setup_mlflow():
         dagshub.init(repo_owner='reemfad51', 
              repo_name='student-gpa-prediction', 
              mlflow=True)
+
+
+def load_registered_model(model_name="gpa_predictor", version=None):
+    """Load a model from the MLflow registry.
+
+    Returns (model, version). When version is None the latest version is used.
+    """
+    if version is None:
+        client = mlflow.tracking.MlflowClient()
+        latest_versions = client.get_latest_versions(model_name, stages=["None"])
+
+        if not latest_versions:
+            raise Exception("No model versions found")
+
+        version = latest_versions[0].version
+
+    model_uri = f"models:/{model_name}/{version}"
+    model = mlflow.sklearn.load_model(model_uri)
+
+    return model, version
+
+
+def load_candidate_model(version, model_name="gpa_predictor"):
+    """Configure MLflow and load one registered version; used inside the shadow scorer process."""
+    setup_mlflow()
+    model, _ = load_registered_model(model_name, version)
+    return model
@@ -11,17 +11,24 @@ class FeaturePreprocessor:
         with open(encoders_path, 'rb') as f:
             self.encoders = pickle.load(f)
         
+        # Lookup tables equivalent to encoder.transform, built once and reused
+        # (pd.Index caches its hash table, unlike a dict passed to Series.map)
+        self.class_index = {
+            col: pd.Index(encoder.classes_)
+            for col, encoder in self.encoders.items()
+        }
+        
         print(f"✅ Loaded {len(self.encoders)} label encoders")
     
-    def prepare_features(self, backend_data):
+    def _feature_dict(self, backend_data):
         """
-        Convert backend data format to model input format
+        Map one backend record to the raw feature dict used for training
         
         Args:
             backend_data: dict from backend API
             
         Returns:
-            pd.DataFrame ready for model prediction
+            dict of raw (unencoded) features
         """
         # Create full feature dict with defaults
         features = {
@@ -48,8 +55,34 @@ class FeaturePreprocessor:
         if isinstance(features['academicyear'], int):
             features['academicyear'] = year_mapping.get(features['academicyear'], 'freshman')
         
+        return features
+    
+    def prepare_features(self, backend_data):
+        """
+        Convert backend data format to model input format
+        
+        Args:
+            backend_data: dict from backend API
+            
+        Returns:
+            pd.DataFrame ready for model prediction
+        """
         # Create DataFrame
-        df = pd.DataFrame([features])
+        df = pd.DataFrame([self._feature_dict(backend_data)])
+        
+        return df
+    
+    def prepare_features_batch(self, records):
+        """
+        Convert many backend records to model input format
+        
+        Args:
+            records: iterable of dicts from backend API or database rows
+            
+        Returns:
+            pd.DataFrame with one row per record
+        """
+        df = pd.DataFrame([self._feature_dict(record) for record in records])
         
         return df
     
@@ -65,21 +98,22 @@ class FeaturePreprocessor:
         """
         df_encoded = df.copy()
         
-        for col, encoder in self.encoders.items():
+        for col, class_index in self.class_index.items():
             if col not in df_encoded.columns:
                 continue
-                
+            
+            values = df[col].astype(str)
+            encoded = class_index.get_indexer(values)
+            
             # Handle unseen categories
-            def safe_encode(value):
-                try:
-                    # Try to encode
-                    return encoder.transform([str(value)])[0]
-                except ValueError:
-                    # Unknown category - use most common class (index 0)
+            unknown = encoded == -1
+            if unknown.any():
+                # Unknown category - use most common class (index 0)
+                for value in values[unknown].unique():
                     print(f"⚠️ Unknown value '{value}' in {col}, using default")
-                    return 0
+                encoded[unknown] = 0
             
-            df_encoded[col] = df[col].apply(safe_encode)
+            df_encoded[col] = encoded
         
         # Ensure correct column order (same as training)
         expected_columns = ['academicyear', 'athleticstatus', 'countryoforigin', 
@@ -114,4 +148,19 @@ class FeaturePreprocessor:
         # Step 3: Convert to numpy array
         X = df_encoded.values
         
-        return X
\ No newline at end of file
+        return X
+    
+    def preprocess_batch(self, records):
+        """
+        Complete preprocessing pipeline for many records at once
+        
+        Args:
+            records: iterable of dicts from backend API or database rows
+            
+        Returns:
+            numpy array with one row per record, ready for model.predict()
+        """
+        df = self.prepare_features_batch(records)
+        df_encoded = self.encode_features(df)
+        
+        return df_encoded.values
\ No newline at end of file
@@ -0,0 +1,309 @@
+"""
+Shadow scoring of a candidate model version.
+
+The serving model answers /predict as usual; the encoded features are handed
+to a bounded queue and a child process scores them in batches with the
+candidate model, so its CPU work never competes with request threads for the
+GIL. The child runs at idle scheduling priority and only gets CPU time the
+serving process does not want. Prediction deltas are sent back and kept next
+to the serving model's latency for comparison.
+
+The child is started with the 'spawn' method and loads the candidate itself,
+so nothing is forked from a process that may already run MLflow/DagsHub
+threads and the model is never copied into the serving process.
+
+Stats are per process: under gunicorn every worker runs its own scorer and
+logs its own stats, which must be summed offline for the full picture.
+"""
+import bisect
+import json
+import math
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+# Upper bounds of the histogram buckets (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, math.inf)
+DELTA_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, math.inf)
+
+
+class Histogram:
+    """Fixed-bucket histogram with approximate quantiles"""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th quantile, capped at the max seen"""
+        if self.count == 0:
+            return None
+
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(self.bounds, self.counts):
+            seen += n
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'p50': self.quantile(0.50),
+            'p99': self.quantile(0.99),
+            'max': self.max,
+            'buckets': {
+                f"<={bound}" if bound != math.inf else "+Inf": n
+                for bound, n in zip(self.bounds, self.counts)
+            },
+        }
+
+
+def _lower_priority():
+    """Only run when the CPU would otherwise be idle"""
+    try:
+        os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+    except (AttributeError, OSError):
+        # Not Linux: fall back to the lowest nice level
+        os.nice(19)
+
+
+def _score_candidate(load_candidate, candidate_version, samples, results, stop,
+                     parent_pid, batch_size, flush_interval):
+    """Child process: load the candidate, score queued samples and send results back"""
+    _lower_priority()
+
+    try:
+        candidate = load_candidate(candidate_version)
+    except Exception as e:
+        print(f"❌ Error loading shadow model {candidate_version}: {e}")
+        results.put(('failed', str(e)))
+        return
+
+    results.put(('ready',))
+
+    while not (stop.is_set() and samples.empty()):
+        # Exit with the serving process instead of lingering as an orphan
+        if os.getppid() != parent_pid:
+            return
+
+        try:
+            batch = [samples.get(timeout=flush_interval)]
+        except queue.Empty:
+            continue
+
+        while len(batch) < batch_size:
+            try:
+                batch.append(samples.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            X = np.vstack([item[0] for item in batch])
+
+            # One row on its own, timed the same way as the serving model
+            start = time.perf_counter()
+            candidate.predict(X[:1])
+            single_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            predictions = candidate.predict(X)
+            batch_ms = (time.perf_counter() - start) * 1000
+
+            if len(predictions) != len(batch):
+                raise ValueError(f"expected {len(batch)} predictions, got {len(predictions)}")
+
+            deltas = [
+                float(prediction) - float(served_prediction)
+                for (_, served_prediction), prediction in zip(batch, predictions)
+            ]
+        except Exception as e:
+            print(f"⚠️ Shadow scoring failed for a batch of {len(batch)}: {e}")
+            results.put(('error', len(batch)))
+            continue
+
+        results.put(('batch', deltas, single_ms, batch_ms))
+
+
+class ShadowScorer:
+    """
+    Score a candidate model off the request path
+
+    submit() never blocks: when the queue is full the sample is dropped and
+    counted, so a slow candidate cannot add latency to /predict.
+    """
+
+    def __init__(self, load_candidate, candidate_version, max_queue_size=1000,
+                 batch_size=64, flush_interval=0.05, log_interval=60):
+        """
+        Args:
+            load_candidate: picklable callable returning the candidate model
+                for a version; called inside the scorer process
+            candidate_version: registry version of the candidate
+            max_queue_size: samples buffered before new ones are dropped
+            batch_size: max samples scored per candidate.predict() call
+            flush_interval: seconds the scorer waits for a new sample
+            log_interval: seconds between stats log lines (0 disables them)
+        """
+        self.candidate_version = candidate_version
+        self.flush_interval = flush_interval
+        self.log_interval = log_interval
+
+        context = multiprocessing.get_context('spawn')
+        self._queue = context.Queue(maxsize=max_queue_size)
+        self._results = context.Queue()
+        self._stop = context.Event()
+        self._process = context.Process(
+            target=_score_candidate,
+            args=(load_candidate, candidate_version, self._queue, self._results,
+                  self._stop, os.getpid(), batch_size, flush_interval),
+            name="shadow-scorer",
+            daemon=True,
+        )
+        self._collector = None
+        self._ready = threading.Event()
+        self._loaded = threading.Event()  # set once loading succeeded or failed
+        self._lock = threading.Lock()
+
+        self.active_latency = Histogram(LATENCY_BUCKETS_MS)
+        self.candidate_latency = Histogram(LATENCY_BUCKETS_MS)
+        self.candidate_batch_latency = Histogram(LATENCY_BUCKETS_MS)
+        self.abs_delta = Histogram(DELTA_BUCKETS)
+        self.delta_sum = 0.0
+        self.scored = 0
+        self.dropped = 0
+        self.errors = 0
+        self.load_error = None
+
+    def start(self):
+        """Start the scoring process and the thread collecting its results"""
+        self._process.start()
+
+        self._collector = threading.Thread(target=self._collect, name="shadow-collector", daemon=True)
+        self._collector.start()
+        return self
+
+    def stop(self, timeout=None):
+        """Score what is already queued, then stop the scoring process"""
+        if not self._process.is_alive():
+            # Nobody is left to read what is still buffered
+            self._queue.cancel_join_thread()
+
+        # Flush samples still buffered in this process before signalling the child
+        self._queue.close()
+        self._queue.join_thread()
+        self._stop.set()
+
+        if self._collector is not None:
+            self._process.join(timeout)
+            self._collector.join(timeout)
+
+    def wait_ready(self, timeout=None):
+        """Block until the candidate is loaded; False on timeout or load failure"""
+        self._loaded.wait(timeout)
+        return self._ready.is_set()
+
+    @property
+    def pid(self):
+        """Process id of the scorer process"""
+        return self._process.pid
+
+    def submit(self, X, served_prediction, served_latency):
+        """
+        Record the serving latency and queue the features for shadow scoring
+
+        Args:
+            X: numpy array passed to the serving model
+            served_prediction: prediction returned to the caller
+            served_latency: seconds the serving model took to predict
+        """
+        with self._lock:
+            # Every request, so dropped samples still count towards the serving model
+            self.active_latency.observe(served_latency * 1000)
+
+        try:
+            self._queue.put_nowait((X, served_prediction))
+        except (queue.Full, ValueError):
+            # ValueError: queue already closed by stop()
+            with self._lock:
+                self.dropped += 1
+
+    def _collect(self):
+        last_log = time.monotonic()
+
+        while True:
+            try:
+                self._merge(self._results.get(timeout=self.flush_interval))
+            except queue.Empty:
+                if not self._process.is_alive():
+                    # Don't leave wait_ready() hanging if the process died while loading
+                    self._loaded.set()
+                    break
+
+            if self.log_interval and time.monotonic() - last_log >= self.log_interval:
+                print(f"📈 Shadow stats {json.dumps(self.stats())}")
+                last_log = time.monotonic()
+
+    def _merge(self, result):
+        with self._lock:
+            if result[0] == 'ready':
+                self._ready.set()
+                self._loaded.set()
+                return
+
+            if result[0] == 'failed':
+                self.load_error = result[1]
+                self._loaded.set()
+                return
+
+            if result[0] == 'error':
+                self.errors += result[1]
+                return
+
+            _, deltas, single_ms, batch_ms = result
+            self.candidate_latency.observe(single_ms)
+            self.candidate_batch_latency.observe(batch_ms)
+            for delta in deltas:
+                self.abs_delta.observe(abs(delta))
+                self.delta_sum += delta
+            self.scored += len(deltas)
+
+    def stats(self):
+        """Snapshot of the comparison so far, for this process only"""
+        with self._lock:
+            return {
+                'pid': os.getpid(),
+                'alive': self._process.is_alive(),
+                'ready': self._ready.is_set(),
+                'load_error': self.load_error,
+                'candidate_version': self.candidate_version,
+                'scored': self.scored,
+                'dropped': self.dropped,
+                'errors': self.errors,
+                'queued': self._queue.qsize() if self._process.is_alive() else 0,
+                'mean_delta': self.delta_sum / self.scored if self.scored else None,
+                'abs_delta': self.abs_delta.to_dict(),
+                'latency_ms': {
+                    # Single-row predict() calls, every request (including dropped samples)
+                    'active': self.active_latency.to_dict(),
+                    # Single-row predict() calls, one sampled per batch
+                    'candidate': self.candidate_latency.to_dict(),
+                    # Whole-batch predict() calls; not comparable with the above
+                    'candidate_batch': self.candidate_batch_latency.to_dict(),
+                },
+            }
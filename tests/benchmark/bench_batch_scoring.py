@@ -0,0 +1,104 @@
+"""
+Benchmark - Bulk scoring from SQLite at 100k and 1M rows
+
+Not collected by pytest. Run from the project root:
+    python tests/benchmark/bench_batch_scoring.py [--rows 100000 1000000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from sqlalchemy import create_engine, text
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.preprocessing import FeaturePreprocessor
+from src.batch_scoring import score_database
+
+UNIVERSITIES = ["American University", "Test University", "Lebanese University", "Unknown XYZ"]
+MAJORS = ["Computer Science", "Business", "Engineering", "Medicine", "Unknown Major"]
+COUNTRIES = ["Iraq", "Lebanon", "Jordan", "Syria", "Unknown Country"]
+
+
+def make_student(student_id, rng):
+    return {
+        'student_id': student_id,
+        'uni_name': rng.choice(UNIVERSITIES),
+        'major': rng.choice(MAJORS),
+        'academic_year': rng.randint(1, 6),
+        'study_hours': round(rng.uniform(0, 12), 1),
+        'athleticstatus': rng.choice(["Active", "Inactive"]),
+        'countryoforigin': rng.choice(COUNTRIES),
+        'countryofresidence': rng.choice(COUNTRIES),
+        'dropout': int(rng.random() < 0.05),
+    }
+
+
+def populate(engine, n_rows, rng, insert_chunk=50000):
+    with engine.begin() as conn:
+        conn.execute(text("PRAGMA journal_mode=WAL"))
+        conn.execute(text(
+            "CREATE TABLE students (student_id INTEGER PRIMARY KEY, uni_name TEXT, "
+            "major TEXT, academic_year INTEGER, study_hours REAL, athleticstatus TEXT, "
+            "countryoforigin TEXT, countryofresidence TEXT, dropout INTEGER)"
+        ))
+
+    insert = text(
+        "INSERT INTO students VALUES (:student_id, :uni_name, :major, :academic_year, "
+        ":study_hours, :athleticstatus, :countryoforigin, :countryofresidence, :dropout)"
+    )
+    for start in range(0, n_rows, insert_chunk):
+        stop = min(start + insert_chunk, n_rows)
+        with engine.begin() as conn:
+            conn.execute(insert, [make_student(i, rng) for i in range(start, stop)])
+
+
+def train_model(preprocessor, rng):
+    """Fit a forest of roughly production size on synthetic students"""
+    X = preprocessor.preprocess_batch([make_student(i, rng) for i in range(5000)])
+    y = np.clip(X[:, 11] / 3 + np.array([rng.gauss(0, 0.3) for _ in range(len(X))]), 0, 4)
+    return RandomForestRegressor(n_estimators=100, max_depth=12, n_jobs=-1, random_state=0).fit(X, y)
+
+
+def bench_single(preprocessor, model, rng, n_rows=500):
+    """Rows per second of the /predict path (one preprocess + predict per student)"""
+    students = [make_student(i, rng) for i in range(n_rows)]
+    start = time.perf_counter()
+    for student in students:
+        model.predict(preprocessor.preprocess(student))
+    return n_rows / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    preprocessor = FeaturePreprocessor('models/label_encoders.pkl')
+    model = train_model(preprocessor, rng)
+
+    print(f"📊 Single-row baseline: {bench_single(preprocessor, model, rng):,.0f} rows/s")
+
+    for n_rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{os.path.join(tmp, 'backend.db')}")
+            populate(engine, n_rows, rng)
+
+            start = time.perf_counter()
+            scored = score_database(engine, model, preprocessor, chunk_size=args.chunk_size)
+            elapsed = time.perf_counter() - start
+            engine.dispose()
+
+        print(f"📊 {scored:,} rows in {elapsed:.1f}s ({scored / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
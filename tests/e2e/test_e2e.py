@@ -96,5 +96,95 @@ def test_error_handling_missing_data(client):
         assert 'error' in data
         print("✅ E2E test passed: Empty data rejected with error message")
 
+class RepeatedCandidate:
+    """CPU-bound candidate: the serving model predicting each batch many times over"""
+
+    def __init__(self, model, repeats):
+        self.model = model
+        self.repeats = repeats
+
+    def predict(self, X):
+        for _ in range(self.repeats - 1):
+            self.model.predict(X)
+        return self.model.predict(X)
+
+def _load_repeated_candidate(repeats, version):
+    """Runs in the shadow scorer process: load the registry version and make it slow"""
+    from src.mlflow_config import load_candidate_model
+    return RepeatedCandidate(load_candidate_model(version), repeats)
+
+def _timed_predictions(client, payloads):
+    latencies = []
+    responses = []
+    for payload in payloads:
+        start = time.perf_counter()
+        response = client.post('/predict', data=json.dumps(payload), content_type='application/json')
+        latencies.append(time.perf_counter() - start)
+        responses.append((response.status_code, json.loads(response.data)))
+    return responses, latencies
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 2,
+                    reason="p99 comparison needs a core the serving process is not using")
+def test_shadow_mode_keeps_response_and_p99(client, monkeypatch):
+    """Test that shadow scoring changes neither the /predict response nor its p99"""
+    import functools
+    import numpy as np
+    import src.app as app_module
+    from src.shadow import ShadowScorer
+    
+    payloads = [
+        {
+            "student_id": i,
+            "uni_name": "American University",
+            "major": "Computer Science",
+            "academic_year": i % 6 + 1,
+            "study_hours": (i % 24) / 2,
+            "athleticstatus": "Active" if i % 2 else "Inactive",
+            "countryoforigin": "Iraq",
+            "countryofresidence": "Iraq",
+            "dropout": False
+        }
+        for i in range(1000)
+    ]
+    
+    # Warm up, then measure twice without a shadow model to get the run-to-run spread
+    monkeypatch.setattr(app_module, 'shadow', None)
+    _timed_predictions(client, payloads[:50])
+    baseline, baseline_latencies = _timed_predictions(client, payloads)
+    repeat, repeat_latencies = _timed_predictions(client, payloads)
+    
+    # Same traffic while the candidate (the serving version doing 20x the sklearn work)
+    # keeps the scorer process busy
+    shadow = ShadowScorer(functools.partial(_load_repeated_candidate, 20), app_module.model_version,
+                          max_queue_size=50, log_interval=0).start()
+    try:
+        assert shadow.wait_ready(timeout=300), f"Shadow model not ready: {shadow.stats()['load_error']}"
+        monkeypatch.setattr(app_module, 'shadow', shadow)
+        shadowed, shadow_latencies = _timed_predictions(client, payloads)
+    finally:
+        shadow.stop(timeout=60)
+    
+    assert repeat == baseline
+    assert shadowed == baseline, "Shadow mode changed /predict responses"
+    
+    p99_runs = [np.percentile(baseline_latencies, 99), np.percentile(repeat_latencies, 99)]
+    p99_shadow = np.percentile(shadow_latencies, 99)
+    spread = abs(p99_runs[0] - p99_runs[1])
+    # Shadow mode may not move p99 further than shadow-off runs move on their own
+    margin = max(2 * spread, 0.001)
+    assert p99_shadow - max(p99_runs) <= margin, \
+        f"p99 rose from {max(p99_runs) * 1000:.1f}ms to {p99_shadow * 1000:.1f}ms with shadow mode " \
+        f"(allowed {margin * 1000:.1f}ms, shadow-off spread {spread * 1000:.1f}ms)"
+    
+    stats = shadow.stats()
+    assert stats['alive'] is False, "Shadow scorer still running after stop()"
+    assert stats['errors'] == 0, f"Shadow scoring failed {stats['errors']} samples"
+    assert stats['scored'] > 0, "Shadow model scored nothing"
+    assert stats['scored'] + stats['dropped'] == len(payloads)
+    assert stats['latency_ms']['active']['count'] == len(payloads)
+    assert stats['abs_delta']['max'] == 0.0, "Identical models should have zero delta"
+    
+    print(f"✅ E2E test passed: p99 {max(p99_runs) * 1000:.1f}ms → {p99_shadow * 1000:.1f}ms with shadow mode")
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,135 @@
+"""
+Integration Tests - Bulk scoring against a SQLite database
+"""
+import pytest
+import sys
+import os
+import numpy as np
+from sqlalchemy import create_engine, text
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.preprocessing import FeaturePreprocessor
+from src.batch_scoring import score_database
+
+STUDENTS = [
+    (1, "American University", "Computer Science", 3, 7.5, "Active", "Iraq", "Iraq", 0),
+    (2, "Test University", "Unknown Major", 1, 2.0, "Inactive", "Lebanon", "Lebanon", 0),
+    (3, None, None, 4, 10.0, None, None, None, 1),
+    (4, "American University", "Computer Science", 2, 0.5, "Active", "Iraq", "Iraq", 0),
+    (5, "Test University", "Computer Science", 5, 4.0, "Inactive", "Iraq", "Lebanon", 0),
+    (6, "Abbott College", "Physics", 2, 3.0, "Active", "Jordan", "Germany", 0),
+]
+
+
+class LinearModel:
+    """Deterministic stand-in for the registry model that reads every feature"""
+
+    weights = np.linspace(0.001, 0.012, 12)
+
+    def predict(self, X):
+        return np.clip(X.astype(float) @ self.weights, 0.0, 4.0)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'backend.db'}")
+
+    with engine.begin() as conn:
+        # Let the writer commit while the reader's cursor is open
+        conn.execute(text("PRAGMA journal_mode=WAL"))
+        conn.execute(text(
+            "CREATE TABLE students (student_id INTEGER PRIMARY KEY, uni_name TEXT, "
+            "major TEXT, academic_year INTEGER, study_hours REAL, athleticstatus TEXT, "
+            "countryoforigin TEXT, countryofresidence TEXT, dropout INTEGER)"
+        ))
+        conn.execute(
+            text("INSERT INTO students VALUES (:id, :uni, :major, :year, :hours, "
+                 ":athletic, :origin, :residence, :dropout)"),
+            [dict(zip(['id', 'uni', 'major', 'year', 'hours', 'athletic',
+                       'origin', 'residence', 'dropout'], row)) for row in STUDENTS]
+        )
+
+    yield engine
+    engine.dispose()
+
+
+def _student_records(engine):
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT * FROM students ORDER BY student_id")).mappings().all()
+    return [{key: value for key, value in row.items() if value is not None} for row in rows]
+
+
+def test_batch_encoding_matches_single_encoding(engine):
+    """Test that batch preprocessing encodes every column exactly like /predict"""
+    preprocessor = FeaturePreprocessor('models/label_encoders.pkl')
+    records = _student_records(engine)
+
+    batch = preprocessor.preprocess_batch(records)
+    single = np.vstack([preprocessor.preprocess(record) for record in records])
+
+    assert batch.shape == (len(STUDENTS), 12), f"Unexpected batch shape {batch.shape}"
+    np.testing.assert_array_equal(batch, single)
+    print("✅ Integration test passed: Batch encoding matches single-record encoding")
+
+
+def test_batch_scoring_matches_single_predictions(engine):
+    """Test that chunked scoring writes the same predictions as /predict would"""
+    preprocessor = FeaturePreprocessor('models/label_encoders.pkl')
+    model = LinearModel()
+
+    scored = score_database(engine, model, preprocessor, chunk_size=2, model_version="7")
+
+    assert scored == len(STUDENTS), f"Expected {len(STUDENTS)} rows scored, got {scored}"
+
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT * FROM students s JOIN gpa_predictions p USING (student_id) "
+            "ORDER BY student_id"
+        )).mappings().all()
+
+    assert len(rows) == len(STUDENTS), "Missing predictions in results table"
+
+    for row in rows:
+        record = {key: value for key, value in row.items() if value is not None}
+        expected = round(float(model.predict(preprocessor.preprocess(record))[0]), 2)
+
+        assert row['predicted_gpa'] == expected, f"Mismatch for student {row['student_id']}"
+        assert row['model_version'] == "7"
+
+    print("✅ Integration test passed: Batch predictions match single predictions")
+
+
+def test_batch_scoring_upserts_existing_rows(engine):
+    """Test that re-scoring updates predictions instead of duplicating them"""
+    preprocessor = FeaturePreprocessor('models/label_encoders.pkl')
+
+    score_database(engine, LinearModel(), preprocessor, model_version="1")
+    score_database(engine, LinearModel(), preprocessor, model_version="2")
+
+    with engine.connect() as conn:
+        versions = conn.execute(text(
+            "SELECT model_version, COUNT(*) FROM gpa_predictions GROUP BY model_version"
+        )).all()
+
+    assert versions == [("2", len(STUDENTS))], f"Unexpected results table contents: {versions}"
+    print("✅ Integration test passed: Re-scoring upserts existing predictions")
+
+
+def test_batch_scoring_rejects_sqlite_without_wal(tmp_path):
+    """Test that a rollback-journal SQLite database fails fast with a clear error"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'backend.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE students (student_id INTEGER PRIMARY KEY)"))
+
+    preprocessor = FeaturePreprocessor('models/label_encoders.pkl')
+    with pytest.raises(ValueError, match="WAL"):
+        score_database(engine, LinearModel(), preprocessor)
+
+    engine.dispose()
+    print("✅ Integration test passed: Non-WAL SQLite database rejected")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,171 @@
+"""
+Unit Tests - Shadow scoring queue and metrics
+"""
+import pytest
+import sys
+import os
+import functools
+import multiprocessing
+import signal
+import subprocess
+import time
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.shadow import ShadowScorer
+
+
+class OffsetModel:
+    """Predicts study hours plus a fixed offset"""
+
+    def __init__(self, offset=0.0, gate=None):
+        self.offset = offset
+        self.gate = gate
+
+    def predict(self, X):
+        if self.gate is not None:
+            self.gate.wait()
+        return X[:, 11].astype(float) + self.offset
+
+
+def _offset_model(offset, version):
+    return OffsetModel(offset=offset)
+
+
+def _gated_model(gate, version):
+    return OffsetModel(gate=gate)
+
+
+def _unavailable_model(version):
+    raise RuntimeError(f"version {version} not found in registry")
+
+
+def _process_gone(pid):
+    """True once pid has exited (a zombie waiting to be reaped counts as gone)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(')', 1)[1].split()[0] == 'Z'
+    except FileNotFoundError:
+        return True
+
+
+def _features(study_hours):
+    X = np.zeros((1, 12))
+    X[0, 11] = study_hours
+    return X
+
+
+def test_shadow_records_deltas_and_latency():
+    """Test that queued samples are scored in batches and compared"""
+    shadow = ShadowScorer(functools.partial(_offset_model, 0.25), "2", batch_size=8,
+                          log_interval=0)
+
+    # Queue everything before the scorer starts so it must batch
+    for hours in range(20):
+        shadow.submit(_features(hours), served_prediction=float(hours), served_latency=0.002)
+    shadow.start().stop(timeout=10)
+
+    stats = shadow.stats()
+    latency = stats['latency_ms']
+
+    assert stats['alive'] is False
+    assert stats['pid'] == os.getpid()
+    assert stats['scored'] == 20, f"Expected 20 scored samples, got {stats['scored']}"
+    assert stats['dropped'] == 0 and stats['errors'] == 0
+    assert stats['mean_delta'] == pytest.approx(0.25)
+    assert stats['abs_delta']['buckets']['<=0.25'] == 20
+    assert latency['active']['buckets']['<=2'] == 20
+    # One single-row timing and one whole-batch timing per batch of at most 8
+    assert 3 <= latency['candidate_batch']['count'] <= 20
+    assert latency['candidate']['count'] == latency['candidate_batch']['count']
+    print("✅ Unit test passed: Shadow deltas and latencies recorded")
+
+
+def test_shadow_counts_failed_batches():
+    """Test that a bad batch is counted as errors and the scorer keeps running"""
+    shadow = ShadowScorer(functools.partial(_offset_model, 0.0), "2", batch_size=2,
+                          log_interval=0).start()
+
+    # A served prediction that float() rejects fails whichever batch it lands in
+    shadow.submit(_features(1.0), served_prediction=1.0, served_latency=0.001)
+    shadow.submit(_features(1.0), served_prediction=None, served_latency=0.001)
+    shadow.submit(_features(2.0), served_prediction=2.0, served_latency=0.001)
+    shadow.submit(_features(3.0), served_prediction=3.0, served_latency=0.001)
+
+    assert shadow.stats()['alive'] is True
+    shadow.stop(timeout=10)
+    stats = shadow.stats()
+
+    assert stats['errors'] > 0, "Expected the mismatched batch to be counted as errors"
+    assert stats['scored'] + stats['errors'] == 4
+    print("✅ Unit test passed: Failed shadow batches counted as errors")
+
+
+def test_shadow_drops_when_queue_full():
+    """Test that submit never blocks when the candidate falls behind"""
+    gate = multiprocessing.get_context('spawn').Event()
+    shadow = ShadowScorer(functools.partial(_gated_model, gate), "2", max_queue_size=5,
+                          batch_size=1, log_interval=0).start()
+
+    for hours in range(50):
+        shadow.submit(_features(hours), served_prediction=0.0, served_latency=0.001)
+
+    gate.set()
+    shadow.stop(timeout=10)
+    stats = shadow.stats()
+
+    assert stats['dropped'] > 0, "Expected samples to be dropped under pressure"
+    assert stats['scored'] + stats['dropped'] == 50
+    # Serving latency is recorded for every request, dropped or not
+    assert stats['latency_ms']['active']['count'] == 50
+    print("✅ Unit test passed: Shadow queue drops under pressure")
+
+
+def test_shadow_reports_load_failure():
+    """Test that a candidate that fails to load is reported, not silently idle"""
+    shadow = ShadowScorer(_unavailable_model, "2", log_interval=0).start()
+    shadow._process.join(30)
+    shadow.stop(timeout=10)
+    stats = shadow.stats()
+
+    assert stats['alive'] is False
+    assert "not found in registry" in stats['load_error']
+    print("✅ Unit test passed: Shadow load failure reported")
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="uses /proc")
+def test_shadow_process_exits_with_parent():
+    """Test that the scorer process does not outlive a SIGKILLed serving process"""
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    script = (
+        "import sys, time\n"
+        f"sys.path.insert(0, {project_root!r})\n"
+        "from src.shadow import ShadowScorer\n"
+        # No samples are submitted, so the loaded 'model' is never used
+        "shadow = ShadowScorer(str, '2', log_interval=0).start()\n"
+        "print(shadow.pid, flush=True)\n"
+        "time.sleep(60)\n"
+    )
+    parent = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, text=True)
+    try:
+        scorer_pid = int(parent.stdout.readline())
+        assert not _process_gone(scorer_pid), "Scorer process did not start"
+
+        parent.send_signal(signal.SIGKILL)
+        parent.wait(timeout=10)
+
+        deadline = time.monotonic() + 10
+        while not _process_gone(scorer_pid) and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+        assert _process_gone(scorer_pid), "Scorer process outlived its parent"
+    finally:
+        parent.kill()
+        parent.stdout.close()
+    print("✅ Unit test passed: Shadow process exits with its parent")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -65,5 +65,31 @@ def test_unknown_category_handling():
     assert X.shape[1] == 12, "Feature count mismatch with unknown values"
     print("✅ Unit test passed: Unknown categories handled gracefully")
 
+def test_encoded_values_for_known_record():
+    """Test that encoding maps known and unknown values to the trained indices"""
+    preprocessor = FeaturePreprocessor('models/label_encoders.pkl')
+    
+    test_data = {
+        "student_id": 1,
+        "uni_name": "Abbott College",
+        "major": "Computer Science",
+        "disability": "Hearing Impairments",
+        "dob": "1960-09-26",
+        "academic_year": 3,
+        "study_hours": 7.5,
+        "athleticstatus": "Inactive",
+        "countryoforigin": "Jordan",
+        "countryofresidence": "Iraq",
+        "dropout": 0
+    }
+    
+    X = preprocessor.preprocess(test_data)
+    
+    # academicyear, athleticstatus, countryoforigin, countryofresidence, disability,
+    # dob, gender (unknown -> 0), major, primarylanguage, university, dropout, study_hours
+    expected = [2, 1, 5, 4, 7, 1, 0, 2, 1, 1, 0, 7.5]
+    assert X.tolist() == [expected], f"Expected {expected}, got {X.tolist()}"
+    print("✅ Unit test passed: Encoded values match trained label encoders")
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file